@@ -1,30 +1,44 @@
 """
-Scrape taught postgraduate programme listings (with pagination) into a list of dictionaries
+Scrape taught postgraduate programme listings (with pagination) into a list of programme records
 and write them to a CSV file.
 
 Overview:
 - Open the HKU TPG listing page.
 - Paginate through all pages until the "next" control disappears or becomes disabled.
 - Extract core programme fields from each listing card.
-- (Optional) For each programme, open the detail page in a temporary new tab and collect "highlight" data.
+- (Optional) Once the listing is collected, open each programme's detail page and collect "highlight" data,
+  either serially in the listing browser or across a pool of worker processes (one Chrome each).
 - Write the aggregated results to a CSV file.
 
 Key robustness features:
+- Detail pages are first fetched over plain HTTP (requests + lxml); Selenium is only used
+  for pages whose highlights are not present in the server-rendered HTML.
 - Explicit waits for elements (Selenium WebDriverWait).
-- Safe element/text/attribute access helpers.
+- Safe element/text access helpers; bulk DOM reads via a single execute_script per page.
 - Retry logic for detail pages.
 - Graceful stop when pagination ends.
 """
 
+import codecs
 import csv
+import os
 import sys
+import multiprocessing
+from multiprocessing.util import Finalize
 from rich import print
 from contextlib import suppress
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple
 from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 
 import typer  # CLI framework (Typer) for easy command definition
+import requests
+from lxml import etree, html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -47,6 +61,8 @@ URL_DEFAULT = "https://portal.hku.hk/tpg-admissions/programme-listing"
 WAIT_SECONDS_PAGES = 15
 # Wait (seconds) for detail page highlight elements
 WAIT_SECONDS_DETAILS = 10
+# Polling interval (seconds) for explicit waits (Selenium default is 0.5)
+WAIT_POLL_SECONDS = 0.15
 
 # CSS selector for each programme entry anchor element in the listing results container
 PROGRAMME_ITEM_SELECTOR = "#programme-listing-results > a"
@@ -54,12 +70,92 @@ PROGRAMME_ITEM_SELECTOR = "#programme-listing-results > a"
 NEXT_LI_SELECTOR = "li.J-paginationjs-next"
 # Selector indicating the active page number (helps detect page change)
 ACTIVE_PAGE_SELECTOR = "li.J-paginationjs-page.active"
+# Snapshot every listing card as [href, faculty, title, abbr, mode] in one WebDriver
+# round-trip (instead of ~5 find_element/.text/get_attribute calls per card).
+LISTING_JS = """
+const text = (el, sel) => {
+    const node = el.querySelector(sel);
+    return node ? node.innerText.trim() : "";
+};
+return Array.from(document.querySelectorAll(arguments[0]), el => {
+    // The selector targets an anchor (<a>), but remain defensive
+    const anchor = el.tagName === "A" ? el : el.querySelector("a");
+    return [
+        anchor ? (anchor.href || "").trim() : "",
+        text(el, ".programme-faculty"),
+        text(el, ".programme-title"),
+        text(el, ".abbreviation"),
+        text(el, ".mode-of-study"),
+    ];
+});
+"""
+
+# Detail page highlight blocks, and the title / description inside each block
+HIGHLIGHT_ITEM_SELECTOR = "#FullTimeTab .highlights-item"
+HIGHLIGHT_TITLE_SELECTOR = ".highlights-item-title"
+HIGHLIGHT_DESC_SELECTOR = ".highlights-item-description"
+
+# Prebuilt (By, selector) locator tuples for waits / find_element (built once, not per call)
+LOC_PROGRAMME_ITEM = (By.CSS_SELECTOR, PROGRAMME_ITEM_SELECTOR)
+LOC_NEXT_LI = (By.CSS_SELECTOR, NEXT_LI_SELECTOR)
+LOC_ACTIVE_PAGE = (By.CSS_SELECTOR, ACTIVE_PAGE_SELECTOR)
+LOC_HIGHLIGHT_ITEM = (By.CSS_SELECTOR, HIGHLIGHT_ITEM_SELECTOR)
+LOC_ANCHOR = (By.TAG_NAME, "a")
+
+# Detail fields filled from the highlight blocks (subset of Programme fields)
+HIGHLIGHT_FIELDS = ("duration", "fees", "start", "deadline", "description")
+# Highlight title keyword -> detail field, checked in order
+_KEYWORD_MAP = (
+    ("duration", "duration"),
+    ("fee", "fees"),
+    ("start", "start"),
+    ("deadline", "deadline"),
+    ("description", "description"),
+    ("overview", "description"),
+)
+
+# Snapshot every highlight block as [title, description] in one WebDriver round-trip
+# (instead of one find_element + .text call per block and field).
+HIGHLIGHTS_JS = """
+const [itemSel, titleSel, descSel] = arguments;
+const text = (el, sel) => {
+    const node = el.querySelector(sel);
+    return node ? node.innerText : "";
+};
+return Array.from(document.querySelectorAll(itemSel), el => [text(el, titleSel), text(el, descSel)]);
+"""
+
+# Timeout (seconds) for plain-HTTP detail page requests
+HTTP_TIMEOUT = 15
+# Browser-like User-Agent for plain-HTTP requests (some portals reject the requests default)
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36"
+)
+
+# Sub-resources Chrome should not download (matched via CDP Network.setBlockedURLs).
+# Only text is scraped, so images, fonts, media and third-party trackers are pure overhead.
+# Stylesheets are kept: the pagination widget and programme tabs rely on them.
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*",
+]
+
+# Chunk size handed to each detail worker process at a time (multiprocess mode only)
+DETAIL_POOL_CHUNKSIZE = 4
 
 # Typer application entry (groups CLI commands)
 app = typer.Typer(help="Scrape HKU TPG programme listings to CSV.")
 
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+; plain dataclass on 3.9
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Programme:
     """
     Data structure representing a single programme row.
@@ -90,6 +186,12 @@ class Programme:
     description: str = ""
 
 
+# CSV column order (mirrors the Programme field order)
+CSV_HEADERS = tuple(f.name for f in fields(Programme))
+# Builds one CSV row tuple from a Programme (shallow; unlike dataclasses.astuple, no deep copy)
+_CSV_ROW = attrgetter(*CSV_HEADERS)
+
+
 # ------------- Helper Functions -------------
 
 
@@ -103,18 +205,27 @@ def _safe_text(parent, by, selector) -> str:
     return ""
 
 
-def _safe_attr(element, attr: str) -> str:
+def _page_changed(driver, old_item, old_page: str) -> bool:
     """
-    Safely fetch an attribute value from an element.
-    Returns empty string if the attribute or element is not accessible.
+    Wait predicate after clicking "next": True once the previous page's first item
+    has gone stale and the active page label differs from `old_page` (label check
+    skipped when the old label is unknown).
     """
-    with suppress(Exception):
-        v = element.get_attribute(attr)
-        return v.strip() if v else ""
-    return ""
+    try:
+        old_item.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        pass
+    if not old_page:
+        return True
+    return _safe_text(driver, *LOC_ACTIVE_PAGE) not in ("", old_page)
 
 
-def create_driver(headless: bool = True) -> webdriver.Chrome:
+def create_driver(
+    headless: bool = True,
+    block_resources: bool = True,
+    profile_dir: Optional[str] = None,
+) -> webdriver.Chrome:
     """
     Create a Selenium Chrome WebDriver.
 
@@ -124,6 +235,9 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
 
     Args:
         headless: Run without a visible browser window if True.
+        block_resources: Skip downloading images/fonts/trackers (see BLOCKED_URL_PATTERNS).
+        profile_dir: Persistent Chrome user-data-dir (keeps cookies/consent and skips
+            first-run setup across launches); None uses a throwaway profile.
 
     Returns:
         Configured Chrome WebDriver instance.
@@ -138,20 +252,73 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-gpu")
     options.add_argument("--disable-dev-shm-usage")
+    # Trim launch work that a scraper never needs
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-sync")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--metrics-recording-only")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(os.path.expanduser(profile_dir))}")
+        options.add_argument("--profile-directory=Default")
+    # Return from get() at DOMContentLoaded; explicit waits cover anything rendered later
+    options.page_load_strategy = "eager"
     try:
         # Preferred: rely on Selenium Manager
-        return webdriver.Chrome(options=options)
+        driver = webdriver.Chrome(options=options)
     except WebDriverException as e:
         print("[yellow]Selenium Manager failed, trying webdriver-manager fallback...[/]")
         try:
             from webdriver_manager.chrome import ChromeDriverManager
             service = Service(ChromeDriverManager().install())
-            return webdriver.Chrome(service=service, options=options)
+            driver = webdriver.Chrome(service=service, options=options)
         except Exception as inner:
             raise RuntimeError(
                 "Could not start Chrome via Selenium Manager or webdriver-manager.\n"
                 f"Selenium error: {e}\nFallback error: {inner}"
             )
+    if block_resources:
+        _block_resources(driver)
+    return driver
+
+
+def _block_resources(driver: webdriver.Chrome) -> None:
+    """
+    Ask Chrome (via DevTools protocol) not to fetch BLOCKED_URL_PATTERNS.
+    Best effort: scraping still works, just slower, if CDP is unavailable.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        print(f"[yellow]Could not enable resource blocking:[/] {e}")
+
+
+def _empty_highlights() -> Dict[str, str]:
+    """Return a fresh highlight dict with every detail field empty."""
+    return dict.fromkeys(HIGHLIGHT_FIELDS, "")
+
+
+def _map_highlights(pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Map raw (title, description) highlight pairs onto the standardized detail fields.
+
+    Titles are matched by broad keywords; each field is filled at most once.
+    Descriptions are whitespace-normalized, whichever path (browser / HTTP) produced them.
+    """
+    highlights = _empty_highlights()
+    for raw_title, raw_description in pairs:
+        title = (raw_title or "").strip().lower()
+        if not title:
+            continue
+        # First keyword whose field is still empty wins; only fill once per field
+        for keyword, field in _KEYWORD_MAP:
+            if keyword in title and not highlights[field]:
+                # Collapse all whitespace so Selenium (innerText) and HTTP (lxml) agree
+                highlights[field] = " ".join((raw_description or "").split())
+                break
+    return highlights
 
 
 def fetch_programme_highlights(
@@ -164,14 +331,15 @@ def fetch_programme_highlights(
     Collect highlight fields from a programme detail page.
 
     Strategy:
-        - Open detail URL in a new tab (keeps listing state pure).
+        - Navigate the driver straight to the detail URL (listing pages are already
+          collected, so there is no listing state to preserve).
         - Wait for at least one highlight block (selector assumed).
-        - Extract highlight blocks and map them into standardized keys.
-        - Close the tab and return to the original window.
+        - Read all highlight blocks with a single execute_script call and map them
+          into standardized keys.
         - Retry on timeout or WebDriver errors.
 
     Args:
-        driver: Active Selenium driver (listing context).
+        driver: Active Selenium driver (its current page is replaced).
         link: Detail page URL.
         retries: Number of retry attempts (in addition to first attempt).
         backoff: Linear backoff multiplier (seconds * attempt_index) between retries.
@@ -180,53 +348,24 @@ def fetch_programme_highlights(
         Dict of highlight fields (duration/fees/start/deadline/description).
     """
     def attempt_once() -> Dict[str, str]:
-        original_window = driver.current_window_handle
-        local_highlights: Dict[str, str] = {
-            "duration": "",
-            "fees": "",
-            "start": "",
-            "deadline": "",
-            "description": "",
-        }
-        try:
-            # Open detail page in a separate tab
-            driver.execute_script("window.open(arguments[0], '_blank');", link)
-            driver.switch_to.window(driver.window_handles[-1])
+        driver.get(link)
 
-            print(f"[bold cyan]>> Visiting[/] {link}")
+        print(f"[bold cyan]>> Visiting[/] {link}")
 
-            # Wait until at least one highlight item appears
-            wait = WebDriverWait(driver, WAIT_SECONDS_DETAILS)
-            wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#FullTimeTab .highlights-item"))
-            )
-
-            # Collect highlight items (adjust selectors if the site changes)
-            items = driver.find_elements(By.CSS_SELECTOR, "#FullTimeTab .highlights-item")
+        # Wait until at least one highlight item appears
+        wait = WebDriverWait(driver, WAIT_SECONDS_DETAILS, poll_frequency=WAIT_POLL_SECONDS)
+        wait.until(
+            EC.presence_of_element_located(LOC_HIGHLIGHT_ITEM)
+        )
 
-            for item in items:
-                title = _safe_text(item, By.CSS_SELECTOR, ".highlights-item-title").lower()
-                description = _safe_text(item, By.CSS_SELECTOR, ".highlights-item-description").replace('\n', ' ')
-                if not title:
-                    continue
-                # Match broad keywords to fill standardized fields; only fill once per field
-                if "duration" in title and not local_highlights["duration"]:
-                    local_highlights["duration"] = description
-                elif "fee" in title and not local_highlights["fees"]:
-                    local_highlights["fees"] = description
-                elif "start" in title and not local_highlights["start"]:
-                    local_highlights["start"] = description
-                elif "deadline" in title and not local_highlights["deadline"]:
-                    local_highlights["deadline"] = description
-                elif ("description" in title or "overview" in title) and not local_highlights["description"]:
-                    local_highlights["description"] = description
-        finally:
-            # Clean up detail tab regardless of success/failure
-            with suppress(Exception):
-                driver.close()
-            with suppress(Exception):
-                driver.switch_to.window(original_window)
-        return local_highlights
+        # Collect all highlight items in one round-trip (adjust selectors if the site changes)
+        pairs = driver.execute_script(
+            HIGHLIGHTS_JS,
+            HIGHLIGHT_ITEM_SELECTOR,
+            HIGHLIGHT_TITLE_SELECTOR,
+            HIGHLIGHT_DESC_SELECTOR,
+        ) or []
+        return _map_highlights(pairs)
 
     # Retry loop
     for attempt in range(retries + 1):
@@ -241,7 +380,317 @@ def fetch_programme_highlights(
             sleep(backoff * (attempt + 1))
 
     print(f"[red]Giving up on detail page after {retries+1} attempts: {link}[/]")
-    return {"duration": "", "fees": "", "start": "", "deadline": "", "description": ""}
+    return _empty_highlights()
+
+
+# ------------- HTTP Detail Fetch -------------
+
+
+def _class_xpath(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name` (CSS `.name`)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath equivalents of the HIGHLIGHT_* CSS selectors, compiled once
+_XPATH_HIGHLIGHT_ITEMS = etree.XPath(
+    f"//*[@id='FullTimeTab']//*[{_class_xpath('highlights-item')}]"
+)
+_XPATH_HIGHLIGHT_TITLE = etree.XPath(f".//*[{_class_xpath('highlights-item-title')}]")
+_XPATH_HIGHLIGHT_DESC = etree.XPath(f".//*[{_class_xpath('highlights-item-description')}]")
+# Nodes whose text innerText would not include (CSS-driven visibility can't be evaluated here)
+_XPATH_NON_RENDERED = etree.XPath(
+    "//script | //style | //noscript | //template | //*[@hidden]"
+    " | //*[contains(translate(@style, ' ', ''), 'display:none')]"
+)
+
+
+def create_http_session(pool_size: int = 8) -> requests.Session:
+    """
+    Create a requests Session for detail pages.
+
+    Keep-alive connections are pooled (one TCP/TLS handshake per connection, not per page)
+    and transient failures are retried by urllib3 with a short exponential backoff.
+    Responses are requested compressed with every encoding urllib3 can decode here
+    (gzip/deflate, plus br / zstd when brotli / zstandard are installed).
+
+    Args:
+        pool_size: Max pooled connections per host (match the number of fetch threads).
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = HTTP_USER_AGENT
+    session.headers["Accept"] = "text/html,application/xhtml+xml;q=0.9,*/*;q=0.1"
+    session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    return session
+
+
+def _node_text(parent, xpath: etree.XPath) -> str:
+    """
+    Return text of the first node matched by `xpath` (empty string if nothing matches).
+    Call _drop_non_rendered on the tree first so the text matches what innerText shows.
+    """
+    nodes = xpath(parent)
+    return nodes[0].text_content() if nodes else ""
+
+
+def _drop_non_rendered(tree) -> bool:
+    """
+    Remove nodes a browser would not render as text (script/style/template and elements
+    hidden via the `hidden` attribute or inline display:none). Tail text is kept.
+
+    Returns:
+        False if the root element itself is hidden (e.g. an anti-FOUC `<html hidden>`
+        revealed by JavaScript); the page then needs the browser. True otherwise.
+    """
+    root_hidden = False
+    for node in _XPATH_NON_RENDERED(tree):
+        if node.getparent() is None:
+            # The root cannot be dropped (lxml asserts); remember it instead
+            root_hidden = True
+            continue
+        node.drop_tree()
+    return not root_hidden
+
+
+def fetch_programme_highlights_http(session: requests.Session, link: str) -> Optional[Dict[str, str]]:
+    """
+    Collect highlight fields from a detail page over plain HTTP (no browser).
+
+    Args:
+        session: Shared requests session.
+        link: Detail page URL.
+
+    Returns:
+        Dict of highlight fields (all empty for non-HTML responses), or None if the
+        request failed or the HTML has no highlight text (caller should fall back to Selenium).
+    """
+    try:
+        response = session.get(link, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+    # Only parse HTML. Anything else (PDF, JSON, ...) has no highlights for Chrome to find
+    # either, so it is a final (empty) result rather than a browser fallback.
+    content_type = response.headers.get("Content-Type", "").lower()
+    if "html" not in content_type:
+        return _empty_highlights()
+
+    # Honour a charset declared in the header; otherwise let libxml2 sniff <meta charset>.
+    # (response.encoding alone is unusable: requests defaults text/* to ISO-8859-1.)
+    parser = None
+    if "charset=" in content_type and response.encoding:
+        with suppress(LookupError):  # unknown charset name -> fall back to sniffing
+            codecs.lookup(response.encoding)
+            parser = lxml_html.HTMLParser(encoding=response.encoding)
+
+    with suppress(etree.ParserError):
+        tree = lxml_html.fromstring(response.content, parser=parser)
+        if not _drop_non_rendered(tree):
+            return None
+        items = _XPATH_HIGHLIGHT_ITEMS(tree)
+        highlights = _map_highlights([
+            (_node_text(item, _XPATH_HIGHLIGHT_TITLE), _node_text(item, _XPATH_HIGHLIGHT_DESC))
+            for item in items
+        ])
+        # An all-empty result is a skeleton filled in by JavaScript: let Chrome handle it
+        if any(highlights.values()):
+            return highlights
+    return None
+
+
+def fetch_all_highlights_http(
+    links: List[str],
+    workers: int = 1,
+    detail_delay: float = 0.0,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch highlights over plain HTTP for many links using a thread pool.
+
+    Args:
+        links: Detail page URLs.
+        workers: Concurrent HTTP requests.
+        detail_delay: Seconds to sleep after each request (per thread).
+
+    Returns:
+        Mapping of link -> highlight dict, only for pages served with highlights.
+    """
+    results: Dict[str, Dict[str, str]] = {}
+    if not links:
+        return results
+
+    session = create_http_session(pool_size=workers)
+
+    def fetch_one(link: str) -> Tuple[str, Optional[Dict[str, str]]]:
+        # One bad page must never abort the detail phase; it just falls back to Chrome
+        try:
+            highlights = fetch_programme_highlights_http(session, link)
+        except Exception as e:
+            print(f"[yellow]HTTP detail fetch failed for {link}, falling back to browser: {e!r}[/]")
+            highlights = None
+        # Optional polite delay to avoid hammering server
+        if detail_delay > 0:
+            sleep(detail_delay)
+        return link, highlights
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for link, highlights in executor.map(fetch_one, links):
+                if highlights is not None:
+                    results[link] = highlights
+    finally:
+        session.close()
+    return results
+
+
+# ------------- Detail Worker Pool -------------
+
+# Per-process state for detail workers (populated by _init_worker_driver).
+# WebDriver is not thread-safe, so parallelism uses processes, each owning its own Chrome.
+_worker_driver: Optional[webdriver.Chrome] = None
+# (retries, backoff, delay) for fetch_programme_highlights / politeness sleep
+_worker_settings: Tuple[int, float, float] = (2, 1.5, 0.0)
+
+
+def _init_worker_driver(
+    headless: bool,
+    block_resources: bool,
+    profile_dir: Optional[str],
+    retries: int,
+    backoff: float,
+    delay: float,
+) -> None:
+    """
+    Pool initializer: create one Chrome instance for this worker process.
+
+    The driver is quit via a multiprocessing finalizer when the worker exits cleanly.
+    Startup failures are reported and leave the worker without a driver (its links get
+    empty highlights) rather than raising, which would make the pool respawn it forever.
+    A persistent profile gets a per-worker suffix, since Chrome locks its user-data-dir.
+    """
+    global _worker_driver, _worker_settings
+    _worker_settings = (retries, backoff, delay)
+    if profile_dir:
+        profile_dir = f"{profile_dir}-{multiprocessing.current_process().name}"
+    try:
+        _worker_driver = create_driver(
+            headless=headless,
+            block_resources=block_resources,
+            profile_dir=profile_dir,
+        )
+    except RuntimeError as e:
+        print(f"[red]Detail worker could not start Chrome:[/] {e}", file=sys.stderr)
+        _worker_driver = None
+        return
+    Finalize(_worker_driver, _worker_driver.quit, exitpriority=10)
+
+
+def _fetch_one_detail(link: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Pool task: fetch highlights for one link using the process-local driver.
+
+    Returns:
+        (link, highlights) so results can be matched back when completed out of order.
+    """
+    if _worker_driver is None:
+        return link, _empty_highlights()
+    retries, backoff, delay = _worker_settings
+    highlights = fetch_programme_highlights(_worker_driver, link, retries=retries, backoff=backoff)
+    # Optional polite delay to avoid hammering server (applies per worker)
+    if delay > 0:
+        sleep(delay)
+    return link, highlights
+
+
+def fetch_all_highlights(
+    driver: webdriver.Chrome,
+    links: List[str],
+    workers: int = 1,
+    headless: bool = True,
+    block_resources: bool = True,
+    profile_dir: Optional[str] = None,
+    detail_delay: float = 0.0,
+    detail_retries: int = 2,
+    detail_retry_backoff: float = 1.5,
+    http_first: bool = True,
+) -> Dict[str, Dict[str, str]]:
+    """
+    Fetch highlight fields for many detail pages.
+
+    If http_first is set, every page is first requested over plain HTTP (`workers` threads);
+    only pages whose highlights are missing from the HTML go through Selenium.
+
+    For Selenium, with workers <= 1 the pages are visited one by one in the given (listing)
+    driver. Otherwise a multiprocessing pool of `workers` processes is started, each with
+    its own headless/visible Chrome, and links are distributed across them.
+
+    Args:
+        driver: Listing driver, used for the serial path.
+        links: Detail page URLs to visit.
+        workers: Parallel HTTP threads and Chrome worker processes.
+        headless: Headless flag for worker browsers.
+        block_resources: Resource blocking flag for worker browsers.
+        profile_dir: Base Chrome profile dir for worker browsers (suffixed per worker).
+        detail_delay: Seconds to sleep after each detail fetch (per worker).
+        detail_retries: Retries for each detail page.
+        detail_retry_backoff: Backoff multiplier for detail retries.
+        http_first: Try plain HTTP before falling back to the browser.
+
+    Returns:
+        Mapping of link -> highlight dict.
+    """
+    results: Dict[str, Dict[str, str]] = {}
+    if http_first and links:
+        results = fetch_all_highlights_http(links, workers=workers, detail_delay=detail_delay)
+        print(f"[green]HTTP detail fetch -> {len(results)}/{len(links)} pages[/]")
+        links = [link for link in links if link not in results]
+    if not links:
+        return results
+
+    # A single remaining link (or worker) is handled by the idle listing driver,
+    # rather than launching a one-process pool with a fresh Chrome
+    workers = min(workers, len(links))
+    if workers <= 1:
+        for link in links:
+            results[link] = fetch_programme_highlights(
+                driver,
+                link,
+                retries=detail_retries,
+                backoff=detail_retry_backoff,
+            )
+            # Optional polite delay to avoid hammering server
+            if detail_delay > 0:
+                sleep(detail_delay)
+        return results
+
+    print(f"[bold cyan]>> Fetching {len(links)} detail pages with {workers} workers[/]")
+    pool = multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_worker_driver,
+        initargs=(
+            headless, block_resources, profile_dir, detail_retries, detail_retry_backoff, detail_delay,
+        ),
+    )
+    try:
+        for link, highlights in pool.imap_unordered(
+            _fetch_one_detail, links, chunksize=DETAIL_POOL_CHUNKSIZE
+        ):
+            results[link] = highlights
+        # Let workers exit normally so their finalizers quit Chrome
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
 
 
 def fetch_programmes(
@@ -253,10 +702,20 @@ def fetch_programmes(
     max_details: Optional[int] = None,
     detail_retries: int = 2,
     detail_retry_backoff: float = 1.5,
-) -> List[Dict[str, str]]:
+    workers: int = 1,
+    block_resources: bool = True,
+    http_first: bool = True,
+    cached_highlights: Optional[Dict[str, Dict[str, str]]] = None,
+    profile_dir: Optional[str] = None,
+) -> List[Programme]:
     """
     Crawl the paginated listing and optionally enrich each programme with detail-page highlights.
 
+    Two phases:
+        1. Paginate the listing and collect core fields for every programme (no detail visits).
+        2. Fetch detail pages over HTTP (`workers` threads), falling back to Chrome (serially,
+           or across `workers` Chrome processes), and merge highlights.
+
     Pagination logic:
         - Loop until "next" pagination element is missing or disabled.
 
@@ -269,53 +728,53 @@ def fetch_programmes(
         max_details: Limit number of detail pages processed (debug/testing).
         detail_retries: Retries for each detail page.
         detail_retry_backoff: Backoff multiplier for detail retries.
+        workers: Parallel detail fetches: HTTP threads and Chrome fallback processes
+            (1 = serial; Chrome fallback runs in the listing browser).
+        block_resources: Skip images/fonts/trackers in every browser started.
+        http_first: Fetch detail pages over plain HTTP first, using Selenium only as fallback.
+        cached_highlights: Known link -> highlights (e.g. from a previous CSV); these
+            programmes are filled from the cache instead of being visited again.
+        profile_dir: Persistent Chrome profile dir (None = fresh profile per launch).
 
     Returns:
-        List of dicts (each representing one programme).
+        List of Programme records.
     """
     driver: Optional[webdriver.Chrome] = None
     try:
-        driver = create_driver(headless=headless)
+        driver = create_driver(
+            headless=headless,
+            block_resources=block_resources,
+            profile_dir=profile_dir,
+        )
         driver.get(url)
 
         print(f"[bold cyan]>> Visiting[/] {url}")
-        print(f"[bold cyan]>> Start Scrapping Programme Details[/]")
+        print("[bold cyan]>> Start Scrapping Programme Listing[/]")
 
-        wait = WebDriverWait(driver, WAIT_SECONDS_PAGES)
+        wait = WebDriverWait(driver, WAIT_SECONDS_PAGES, poll_frequency=WAIT_POLL_SECONDS)
 
         programmes: List[Programme] = []
         seen_links = set()          # Prevent duplicate rows if any link repeats
-        details_count = 0           # Counter for number of detail pages fetched
         page_index = 1              # Human-readable page index
 
         while True:
             # Wait for programme items on the current page
             items = wait.until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, PROGRAMME_ITEM_SELECTOR))
+                EC.presence_of_all_elements_located(LOC_PROGRAMME_ITEM)
             )
 
             # Try to capture active page number (for logging)
             current_page_label = ""
             with suppress(Exception):
-                current_page_label = _safe_text(driver, By.CSS_SELECTOR, ACTIVE_PAGE_SELECTOR)
+                current_page_label = _safe_text(driver, *LOC_ACTIVE_PAGE)
 
             new_in_page = 0  # Count new items added for this page
 
-            # Iterate through programme items
-            for item in items:
-                # The selector targets an anchor (<a>), but remain defensive
-                anchor = item if item.tag_name.lower() == "a" else None
-                if not anchor:
-                    with suppress(NoSuchElementException):
-                        anchor = item.find_element(By.TAG_NAME, "a")
-
-                # Extract visible listing fields
-                faculty = _safe_text(item, By.CSS_SELECTOR, ".programme-faculty")
-                title = _safe_text(item, By.CSS_SELECTOR, ".programme-title")
-                abbr = _safe_text(item, By.CSS_SELECTOR, ".abbreviation")
-                mode = _safe_text(item, By.CSS_SELECTOR, ".mode-of-study")
-                link = _safe_attr(anchor, "href") if anchor else ""
+            # Snapshot all listing fields for this page in one round-trip
+            cards = driver.execute_script(LISTING_JS, PROGRAMME_ITEM_SELECTOR) or []
 
+            # Iterate through programme cards
+            for link, faculty, title, abbr, mode in cards:
                 # Basic validation and dedupe
                 if not link or link in seen_links:
                     continue
@@ -323,29 +782,7 @@ def fetch_programmes(
                     # Skip entries that appear structurally empty
                     continue
 
-                # Default empty detail fields until (optionally) filled
-                duration = fees = start = deadline = description = ""
-
-                # Detail page enrichment (if enabled and within max_details)
-                if fetch_details and (max_details is None or details_count < max_details):
-                    highlights = fetch_programme_highlights(
-                        driver,
-                        link,
-                        retries=detail_retries,
-                        backoff=detail_retry_backoff
-                    )
-                    duration = highlights["duration"]
-                    fees = highlights["fees"]
-                    start = highlights["start"]
-                    deadline = highlights["deadline"]
-                    description = highlights["description"]
-                    details_count += 1
-
-                    # Optional polite delay to avoid hammering server
-                    if detail_delay > 0:
-                        sleep(detail_delay)
-
-                # Append structured programme object
+                # Append structured programme object (detail fields filled in phase 2)
                 programmes.append(
                     Programme(
                         abbr=abbr,
@@ -354,11 +791,6 @@ def fetch_programmes(
                         title=title,
                         mode=mode,
                         link=link,
-                        duration=duration,
-                        fees=fees,
-                        start=start,
-                        deadline=deadline,
-                        description=description,
                     )
                 )
                 seen_links.add(link)
@@ -367,12 +799,12 @@ def fetch_programmes(
             # Progress log line
             print(
                 f"[green]Page {page_index} ({current_page_label}) -> collected {new_in_page}, "
-                f"total {len(programmes)} (details: {details_count})[/]"
+                f"total {len(programmes)}[/]"
             )
 
             # Attempt to locate pagination "next" control
             try:
-                next_li = driver.find_element(By.CSS_SELECTOR, NEXT_LI_SELECTOR)
+                next_li = driver.find_element(*LOC_NEXT_LI)
             except NoSuchElementException:
                 print("[yellow]No next pagination element. Stopping.[/]")
                 break
@@ -385,7 +817,7 @@ def fetch_programmes(
 
             # Get the <a> inside the pagination item
             try:
-                next_a = next_li.find_element(By.TAG_NAME, "a")
+                next_a = next_li.find_element(*LOC_ANCHOR)
             except NoSuchElementException:
                 print("[yellow]Next link missing inside pagination element. Stopping.[/]")
                 break
@@ -396,22 +828,41 @@ def fetch_programmes(
             # Navigate to the next page
             next_a.click()
 
-            # Wait for prior page contents to become stale / page number to change
+            # Single wait: prior page contents stale AND page number changed
             with suppress(Exception):
-                wait.until(EC.staleness_of(first_item))
-            with suppress(Exception):
-                old_page = current_page_label
-                if old_page:
-                    wait.until_not(
-                        EC.text_to_be_present_in_element(
-                            (By.CSS_SELECTOR, ACTIVE_PAGE_SELECTOR), old_page
-                        )
-                    )
+                wait.until(lambda d: _page_changed(d, first_item, current_page_label))
 
             page_index += 1  # Increment manual page counter
 
-        # Convert dataclass objects to plain dictionaries (CSV / JSON friendly)
-        return [asdict(p) for p in programmes]
+        # Detail page enrichment (if enabled and within max_details)
+        if fetch_details:
+            cached = cached_highlights or {}
+            pending = [p for p in programmes if p.link not in cached]
+            targets = pending if max_details is None else pending[:max_details]
+            print("[bold cyan]>> Start Scrapping Programme Details[/]")
+            if cached:
+                print(f"[green]Reusing cached details for {len(programmes) - len(pending)} programmes[/]")
+            highlights_by_link = fetch_all_highlights(
+                driver,
+                [p.link for p in targets],
+                workers=workers,
+                headless=headless,
+                block_resources=block_resources,
+                profile_dir=profile_dir,
+                detail_delay=detail_delay,
+                detail_retries=detail_retries,
+                detail_retry_backoff=detail_retry_backoff,
+                http_first=http_first,
+            )
+            for p in programmes:
+                highlights = cached.get(p.link) or highlights_by_link.get(p.link)
+                if not highlights:
+                    continue
+                for field in HIGHLIGHT_FIELDS:
+                    setattr(p, field, highlights[field])
+            print(f"[green]Fetched details for {len(highlights_by_link)} programmes[/]")
+
+        return programmes
 
     except TimeoutException:
         print("[red]Timed out waiting for programme items.[/]", file=sys.stderr)
@@ -425,36 +876,50 @@ def fetch_programmes(
             driver.quit()
 
 
-def write_csv(rows: List[Dict[str, str]], filepath: str = "programmes.csv") -> None:
+def load_cached_highlights(filepath: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load detail fields from a previously written CSV, keyed by programme link.
+
+    Rows without any detail field filled are ignored, so they get fetched again.
+
+    Args:
+        filepath: CSV written by an earlier run (missing file -> empty cache).
+
+    Returns:
+        Mapping of link -> highlight dict.
+    """
+    cached: Dict[str, Dict[str, str]] = {}
+    if not os.path.exists(filepath):
+        return cached
+    with open(filepath, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            link = row.get("link") or ""
+            highlights = {field: row.get(field) or "" for field in HIGHLIGHT_FIELDS}
+            if link and any(highlights.values()):
+                cached[link] = highlights
+    return cached
+
+
+def write_csv(rows: List[Programme], filepath: str = "programmes.csv") -> None:
     """
     Write programme data to a CSV file.
 
+    Columns follow the Programme field order; rows are written as plain tuples
+    (no per-row dict conversion).
+
     Args:
-        rows: List of programme dicts.
+        rows: List of Programme records.
         filepath: Output CSV path/name.
     """
     if not rows:
         print("[yellow]No data to write.[/]")
         return
 
-    headers = [
-        "abbr",
-        "university",
-        "faculty",
-        "title",
-        "mode",
-        "link",
-        "duration",
-        "fees",
-        "start",
-        "deadline",
-        "description",
-    ]
-
     with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADERS)
+        for p in rows:
+            writer.writerow(_CSV_ROW(p))
 
     print(f"[bold green]Wrote {len(rows)} rows to {filepath}[/]")
 
@@ -473,6 +938,11 @@ def scrape(
     delay: float = typer.Option(0.0, "--detail-delay", help="Delay seconds between detail page fetches."),
     retries: int = typer.Option(2, "--retries", help="Retry count per detail page."),
     backoff: float = typer.Option(1.5, "--backoff", help="Backoff multiplier between detail retries."),
+    workers: int = typer.Option(1, "--workers", min=1, help="Parallel detail fetches (HTTP threads / Chrome processes)."),
+    block: bool = typer.Option(True, "--block-resources/--no-block-resources", help="Skip images, fonts and trackers."),
+    http_first: bool = typer.Option(True, "--http-first/--no-http-first", help="Try plain HTTP for detail pages before Chrome."),
+    incremental: bool = typer.Option(False, "--incremental/--no-incremental", help="Reuse details already in the output CSV."),
+    profile_dir: Optional[str] = typer.Option(None, "--profile-dir", help="Persistent Chrome profile directory."),
 ):
     """
     Run the full scrape and write results to CSV.
@@ -480,6 +950,7 @@ def scrape(
     Example:
         python hku_tpg_scrapper.py scrape --no-headless --max-details 5
     """
+    cached = load_cached_highlights(out) if incremental else None
     rows = fetch_programmes(
         label=label,
         url=url,
@@ -489,6 +960,11 @@ def scrape(
         max_details=max_details,
         detail_retries=retries,
         detail_retry_backoff=backoff,
+        workers=workers,
+        block_resources=block,
+        http_first=http_first,
+        cached_highlights=cached,
+        profile_dir=profile_dir,
     )
     write_csv(rows, out)
 
@@ -496,10 +972,12 @@ def scrape(
 @app.command()
 def version():
     """
-    Show versions of key libraries (currently only Selenium reported).
+    Show versions of key libraries (Selenium, requests, lxml).
     """
     import selenium
     print(f"selenium={selenium.__version__}")
+    print(f"requests={requests.__version__}")
+    print(f"lxml={etree.__version__}")
 
 
 # ------------- Entry Point -------------